@@ -23,8 +23,8 @@ async def example_orion():
     
     print(f"Orion Composition for 1920x1080:")
     print(f"  Focal points: {len(composition.focal_points)}")
-    print(f"  Visual flow: {composition.visual_flow['flow_type']}")
-    print(f"  Balance: {composition.balance['balance_type']}")
+    print(f"  Visual flow: {composition.visual_flow.flow_type}")
+    print(f"  Balance: {composition.balance.balance_type}")
     print(f"  Themes: {', '.join(composition.mythology_themes)}")
 
 
@@ -7,22 +7,47 @@ Translates star positions, magnitudes, and mythological narratives into visual g
 
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, List, Dict, Any, Literal, Tuple
-from enum import Enum
-import httpx
-import json
+from msgspec import Struct
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, FrozenSet, List, Literal, Mapping, Optional,
+    Sequence, Tuple
+)
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+import asyncio
+import importlib.util
 import math
+import msgspec
+import os
+import random
+import sys
+import time
 import numpy as np
 
+if TYPE_CHECKING:
+    import httpx
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await _close_http_client()
+
+
 # Initialize MCP server
-mcp = FastMCP("constellation_composition_mcp")
+mcp = FastMCP("constellation_composition_mcp", lifespan=_lifespan)
 
 # ============================================================================
 # CONSTELLATION DATA
 # ============================================================================
 
 # IAU 88 official constellations with metadata
-CONSTELLATIONS = {
+_CONSTELLATIONS: Dict[str, Dict[str, Any]] = {
     "Andromeda": {
         "abbr": "And",
         "genitive": "Andromedae",
@@ -245,6 +270,111 @@ CONSTELLATIONS = {
     }
 }
 
+# Read-only, interned view shared by all callers. Rows are never mutated, so
+# they can be handed out directly without defensive copies.
+CONSTELLATIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    name: MappingProxyType({
+        key: sys.intern(value) if isinstance(value, str) else value
+        for key, value in data.items()
+    })
+    for name, data in _CONSTELLATIONS.items()
+})
+
+# Case-folded name and abbreviation -> canonical name. Names are added last so
+# they take precedence over any colliding abbreviation.
+_NAME_LOOKUP: Dict[str, str] = {
+    **{data['abbr'].casefold(): name for name, data in CONSTELLATIONS.items()},
+    **{name.casefold(): name for name in CONSTELLATIONS}
+}
+
+
+@lru_cache(maxsize=128)
+def _normalize_constellation_name(v: str) -> str:
+    """Canonical constellation name for a name or abbreviation, else v stripped."""
+    v = v.strip()
+    return _NAME_LOOKUP.get(v.casefold(), v)
+
+# Struct-of-arrays view of the database for scans across every constellation.
+# Columns are parallel tuples indexed like NAMES and share the interned
+# strings of the rows above.
+NAMES = tuple(CONSTELLATIONS)
+ABBRS = tuple(data['abbr'] for data in CONSTELLATIONS.values())
+SHAPES = tuple(data['shape'] for data in CONSTELLATIONS.values())
+BRIGHTNESS = tuple(data['brightness_profile'] for data in CONSTELLATIONS.values())
+STAR_COUNTS = tuple(data['star_count_visual'] for data in CONSTELLATIONS.values())
+STORIES = tuple(data['story'] for data in CONSTELLATIONS.values())
+THEMES = tuple(data['theme'] for data in CONSTELLATIONS.values())
+VIS_CHAR = tuple(data['visual_character'] for data in CONSTELLATIONS.values())
+
+# Catalogue rows in name order, for listings and "available" hints
+_SORTED_CONSTELLATION_ITEMS = tuple(sorted(CONSTELLATIONS.items()))
+
+
+class _ConstMeta(Struct, frozen=True, gc=False):
+    """Metadata fields used by the composition mapping, normalized once."""
+    shape: str
+    brightness: str
+    star_count: int
+    story_lower: str
+    theme_lower: str
+    theme_tokens: Tuple[str, ...]
+
+
+def _const_meta(metadata: Mapping[str, Any]) -> _ConstMeta:
+    """Normalize a metadata dict, applying the mapping's defaults for missing keys."""
+    theme_lower = metadata.get('theme', '').lower()
+    return _ConstMeta(
+        shape=metadata.get('shape', 'dispersed'),
+        brightness=metadata.get('brightness_profile', 'moderate'),
+        star_count=metadata.get('star_count_visual', 5),
+        story_lower=metadata.get('story', '').lower(),
+        theme_lower=theme_lower,
+        theme_tokens=tuple(
+            sys.intern(t.strip()) for t in theme_lower.split(',')
+        ) if theme_lower else (),
+    )
+
+
+# Normalized metadata per catalogue constellation, so the composition path
+# reads attributes instead of repeating dict lookups and lower-casing.
+_META: Dict[str, _ConstMeta] = {name: _const_meta(data) for name, data in CONSTELLATIONS.items()}
+
+# Categorical codes for the shape and brightness columns. Filters match by
+# substring, so a filter term is resolved against the few distinct categories
+# and rows are then selected with a single array comparison.
+_SHAPE_CATEGORIES = tuple(sorted(set(SHAPES)))
+_SHAPE_CODES = np.array([_SHAPE_CATEGORIES.index(v) for v in SHAPES], dtype=np.uint8)
+_BRIGHTNESS_CATEGORIES = tuple(sorted(set(BRIGHTNESS)))
+_BRIGHTNESS_CODES = np.array(
+    [_BRIGHTNESS_CATEGORIES.index(v) for v in BRIGHTNESS], dtype=np.uint8
+)
+
+# Lower-cased categories and code column per filterable field
+_CATEGORY_COLUMNS: Dict[str, Tuple[Tuple[str, ...], np.ndarray]] = {
+    'shape': (tuple(c.lower() for c in _SHAPE_CATEGORIES), _SHAPE_CODES),
+    'brightness': (tuple(c.lower() for c in _BRIGHTNESS_CATEGORIES), _BRIGHTNESS_CODES),
+}
+
+
+@lru_cache(maxsize=256)
+def _category_rows(column: str, term: str) -> FrozenSet[int]:
+    """
+    Rows whose category in column contains term.
+
+    term must already be stripped and lower-cased; results are memoized per
+    term so repeated filters cost a cache lookup.
+    """
+    categories, codes = _CATEGORY_COLUMNS[column]
+    matching = [code for code, category in enumerate(categories) if term in category]
+    return frozenset(np.flatnonzero(np.isin(codes, matching)).tolist())
+
+
+# Lower-cased search text per row, aligned with NAMES, so queries scan
+# prebuilt strings instead of formatting and lowering every row per call.
+_SEARCH_INDEX: Tuple[str, ...] = tuple(
+    " ".join(fields).lower() for fields in zip(NAMES, STORIES, THEMES, VIS_CHAR)
+)
+
 # ============================================================================
 # PHASE 2.6 - CONSTELLATION PARAMETER SPACE & RHYTHMIC PRESETS
 # ============================================================================
@@ -494,39 +624,73 @@ CONSTELLATION_VISUAL_TYPES = {
 # PYDANTIC MODELS
 # ============================================================================
 
-class ResponseFormat(str, Enum):
-    """Output format for responses."""
-    MARKDOWN = "markdown"
-    JSON = "json"
+# Output format for responses
+ResponseFormat = Literal["markdown", "json"]
 
 
-class CompositionParameters(BaseModel):
-    """Structured composition parameters derived from constellation."""
-    model_config = ConfigDict(str_strip_whitespace=True)
-    
-    focal_points: List[Dict[str, float]] = Field(
-        description="Primary focal points mapped from brightest stars, with x/y coordinates (0-1) and visual weight"
-    )
-    visual_flow: Dict[str, Any] = Field(
-        description="Directional flow and movement patterns"
-    )
-    balance: Dict[str, Any] = Field(
-        description="Visual balance characteristics"
-    )
-    spatial_distribution: str = Field(
-        description="How elements spread across the frame"
-    )
-    mythology_themes: List[str] = Field(
-        description="Key thematic elements from constellation mythology"
-    )
-    suggested_elements: Dict[str, List[str]] = Field(
-        description="Suggested visual elements organized by category"
-    )
+class FocalPoint(Struct, frozen=True, gc=False):
+    """Focal point in normalized (0-1) canvas coordinates with visual weight."""
+    x: float
+    y: float
+    weight: float
+
+
+class VisualFlow(Struct, frozen=True, gc=False):
+    """Directional flow and movement patterns."""
+    primary_direction: str
+    flow_type: str
+    movement_quality: str
+    rhythm: str
+
+
+class CenterOfMass(Struct, frozen=True, gc=False):
+    """Weighted centroid of the focal points."""
+    x: float
+    y: float
+
+
+class Balance(Struct, frozen=True, gc=False):
+    """Visual balance characteristics."""
+    balance_type: str
+    center_of_mass: CenterOfMass
+    symmetry: str
+    stability: str
+
+
+class SuggestedElements(Struct, frozen=True, gc=False):
+    """Suggested visual elements organized by category."""
+    subjects: Tuple[str, ...]
+    lighting: Tuple[str, ...]
+    atmosphere: Tuple[str, ...]
+    color_palette: Tuple[str, ...]
+
+
+class CompositionParameters(Struct, frozen=True, gc=False):
+    """
+    Structured composition parameters derived from constellation.
+
+    Built internally on every composition call, so this is a msgspec Struct
+    rather than a validating Pydantic model. Fields:
+
+    - focal_points: Primary focal points mapped from brightest stars, with
+      x/y coordinates (0-1) and visual weight
+    - visual_flow: Directional flow and movement patterns
+    - balance: Visual balance characteristics
+    - spatial_distribution: How elements spread across the frame
+    - mythology_themes: Key thematic elements from constellation mythology
+    - suggested_elements: Suggested visual elements organized by category
+    """
+    focal_points: Tuple[FocalPoint, ...]
+    visual_flow: VisualFlow
+    balance: Balance
+    spatial_distribution: str
+    mythology_themes: Tuple[str, ...]
+    suggested_elements: SuggestedElements
 
 
 class ConstellationSearchInput(BaseModel):
     """Input for searching constellations."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    model_config = ConfigDict(extra='forbid')
     
     query: Optional[str] = Field(
         default=None,
@@ -541,14 +705,14 @@ class ConstellationSearchInput(BaseModel):
         description="Filter by brightness: faint, moderate, bright, very_bright, extremely_bright"
     )
     response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
+        default="markdown",
         description="Output format: 'markdown' for human-readable or 'json' for structured data"
     )
 
 
 class ConstellationCompositionInput(BaseModel):
     """Input for generating composition from constellation."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
+    model_config = ConfigDict(extra='forbid')
     
     constellation_name: str = Field(
         description="Name of constellation (e.g., 'Orion', 'Cassiopeia', 'Ursa Major')",
@@ -571,26 +735,24 @@ class ConstellationCompositionInput(BaseModel):
         default=True,
         description="Include mythological themes and narrative elements"
     )
+    include_geometry: bool = Field(
+        default=False,
+        description="Fetch the constellation's star-line GeoJSON and include it in JSON output (ignored for markdown)"
+    )
     response_format: ResponseFormat = Field(
-        default=ResponseFormat.JSON,
+        default="json",
         description="Output format: 'json' for structured parameters or 'markdown' for descriptive guidance"
     )
     
-    @field_validator('constellation_name')
+    @field_validator('constellation_name', mode='before')
     @classmethod
-    def validate_constellation(cls, v: str) -> str:
+    def validate_constellation(cls, v: Any) -> Any:
         """Validate constellation name exists."""
-        # Try exact match first
-        for name in CONSTELLATIONS.keys():
-            if v.lower() == name.lower():
-                return name
-        
-        # Try abbreviation match
-        for name, data in CONSTELLATIONS.items():
-            if v.lower() == data['abbr'].lower():
-                return name
-        
-        # If not found, return original (will be handled in tool)
+        # Match name or abbreviation; if not found, return original (will be
+        # handled in tool). Runs before the length constraints so they apply
+        # to the stripped name.
+        if isinstance(v, str):
+            return _normalize_constellation_name(v)
         return v
 
 
@@ -674,36 +836,166 @@ class AttractorPromptInput(BaseModel):
         return v
 
 
+# msgspec codecs are built once at import and reused on every request
+_ENC = msgspec.json.Encoder()
+_DEC_GEOJSON = msgspec.json.Decoder(Dict[str, Any])
+
+
+def _dumps(obj: Any) -> str:
+    """Encode a tool response as indented JSON text."""
+    return msgspec.json.format(_ENC.encode(obj), indent=2).decode()
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+_GEOJSON_URL = "https://cdn.jsdelivr.net/gh/dieghernan/celestial_data@main/data/constellations.lines.min.geojson"
+_GEOJSON_TTL_SECONDS = 24 * 60 * 60
+_GEOJSON_RETRY_SECONDS = 60
+# Downloaded GeoJSON is kept on disk across restarts unless disabled with
+# CONSTELLATION_COMPOSITION_MCP_DISK_CACHE=0
+_GEOJSON_CACHE_PATH: Optional[Path] = (
+    None
+    if os.environ.get("CONSTELLATION_COMPOSITION_MCP_DISK_CACHE", "1").lower()
+    in ("0", "false", "no", "off")
+    else Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "constellation_composition_mcp"
+    / "constellations.lines.min.geojson"
+)
+
+# Constellation line features by IAU abbreviation, valid until the monotonic
+# deadline; the lock makes concurrent callers share a single fetch
+_GEOJSON_INDEX: Dict[str, Dict[str, Any]] = {}
+_GEOJSON_EXPIRES_AT: float = 0.0
+_GEOJSON_LOCK = asyncio.Lock()
+
+# Shared HTTP client so repeat fetches reuse the CDN connection. HTTP/2 needs
+# the optional h2 package (httpx[http2]); without it the client uses HTTP/1.1.
+_HTTP_CLIENT: Optional["httpx.AsyncClient"] = None
+
+
+def _get_http_client() -> "httpx.AsyncClient":
+    """Return the shared httpx.AsyncClient, creating it on first use."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        # Imported lazily: httpx is only needed on this path and is one of the
+        # heavier imports at server start-up
+        import httpx
+
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300),
+        )
+    return _HTTP_CLIENT
+
+
+async def _close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+def _index_geojson(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map feature id (constellation abbreviation) to its first GeoJSON feature."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for feature in data.get('features', []):
+        index.setdefault(feature.get('properties', {}).get('id'), feature)
+    return index
+
+
+def _read_geojson_cache_file() -> Optional[Tuple[Dict[str, Any], float]]:
+    """Return the on-disk GeoJSON copy and its age in seconds, if still fresh."""
+    path = _GEOJSON_CACHE_PATH
+    if path is None:
+        return None
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age >= _GEOJSON_TTL_SECONDS:
+            return None
+        return _DEC_GEOJSON.decode(path.read_bytes()), age
+    except Exception:
+        return None
+
+
+def _write_geojson_cache_file(content: bytes) -> None:
+    """Best-effort save of the downloaded GeoJSON so restarts skip the fetch."""
+    path = _GEOJSON_CACHE_PATH
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    except OSError:
+        pass
+
+
+async def _download_geojson() -> Optional[Dict[str, Any]]:
+    """Download and decode the constellation lines GeoJSON."""
+    try:
+        response = await _get_http_client().get(_GEOJSON_URL)
+        response.raise_for_status()
+        data = _DEC_GEOJSON.decode(response.content)
+    except Exception:
+        return None
+    await asyncio.to_thread(_write_geojson_cache_file, response.content)
+    return data
+
+
+async def _get_geojson_index() -> Dict[str, Dict[str, Any]]:
+    """
+    Constellation line features by abbreviation, loaded at most once per TTL.
+
+    A fresh on-disk copy (when the disk cache is enabled) is preferred over
+    the network; file access runs in a worker thread so the event loop is not
+    blocked. If loading fails the previous index (empty at first) is kept and
+    retried after a short delay.
+    """
+    global _GEOJSON_INDEX, _GEOJSON_EXPIRES_AT
+
+    if time.monotonic() < _GEOJSON_EXPIRES_AT:
+        return _GEOJSON_INDEX
+
+    async with _GEOJSON_LOCK:
+        # Another caller may have refreshed the index while we waited
+        if time.monotonic() < _GEOJSON_EXPIRES_AT:
+            return _GEOJSON_INDEX
+
+        ttl: float = _GEOJSON_TTL_SECONDS
+        data: Optional[Dict[str, Any]]
+        cached = await asyncio.to_thread(_read_geojson_cache_file)
+        if cached is not None:
+            data, age = cached
+            ttl -= age
+        else:
+            data = await _download_geojson()
+
+        if data is not None:
+            _GEOJSON_INDEX = _index_geojson(data)
+            _GEOJSON_EXPIRES_AT = time.monotonic() + ttl
+        else:
+            _GEOJSON_EXPIRES_AT = time.monotonic() + _GEOJSON_RETRY_SECONDS
+        return _GEOJSON_INDEX
+
+
 async def fetch_constellation_data(constellation_abbr: str) -> Optional[Dict[str, Any]]:
     """
     Fetch constellation line data from d3-celestial repository.
     Returns GeoJSON with star positions and connections.
+
+    The source file is fetched once and indexed by abbreviation, so repeated
+    calls are a dictionary lookup until the cache expires.
     """
-    url = f"https://cdn.jsdelivr.net/gh/dieghernan/celestial_data@main/data/constellations.lines.min.geojson"
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Find constellation by abbreviation
-            for feature in data.get('features', []):
-                if feature.get('properties', {}).get('id') == constellation_abbr:
-                    return feature
-            
-            return None
-    except Exception as e:
-        return None
+    index = await _get_geojson_index()
+    return index.get(constellation_abbr)
 
 
 def map_constellation_to_composition(
     constellation_name: str,
-    metadata: Dict[str, Any],
+    metadata: Mapping[str, Any],
     geometry_data: Optional[Dict[str, Any]],
     canvas_width: int,
     canvas_height: int,
@@ -712,31 +1004,83 @@ def map_constellation_to_composition(
     """
     Core deterministic mapping from constellation data to composition parameters.
     This is the zero-LLM-cost layer that handles pure geometric translation.
+
+    Results for catalogue constellations without geometry data are memoized,
+    so the returned parameters may be shared and must be treated as read-only.
+    """
+    if geometry_data is None and metadata is CONSTELLATIONS.get(constellation_name):
+        return _cached_composition(
+            constellation_name, canvas_width, canvas_height, include_mythology
+        )
+    return _compute_composition(
+        _const_meta(metadata), geometry_data, canvas_width, canvas_height, include_mythology
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_composition(
+    constellation_name: str,
+    canvas_width: int,
+    canvas_height: int,
+    include_mythology: bool
+) -> CompositionParameters:
+    """Memoized composition for a catalogue constellation (no geometry data)."""
+    return _compute_composition(
+        _META[constellation_name], None, canvas_width, canvas_height, include_mythology,
+        focal_template=_TEMPLATES[constellation_name]
+    )
+
+
+def _composition_cache_clear() -> None:
+    """Drop all memoized compositions and rendered composition responses."""
+    _cached_composition.cache_clear()
+    _cached_composition_response.cache_clear()
+
+
+def _compute_composition(
+    meta: _ConstMeta,
+    geometry_data: Optional[Dict[str, Any]],
+    canvas_width: int,
+    canvas_height: int,
+    include_mythology: bool,
+    focal_template: Optional[Tuple[np.ndarray, np.ndarray]] = None
+) -> CompositionParameters:
+    """
+    Uncached body of map_constellation_to_composition.
+
+    focal_template is a precomputed (focal_xy, focal_w) pair from _TEMPLATES;
+    when omitted the focal points are generated from the metadata.
     """
     
     # Extract visual characteristics
-    shape = metadata.get('shape', 'dispersed')
-    brightness = metadata.get('brightness_profile', 'moderate')
+    shape = meta.shape
+    brightness = meta.brightness
     
     # Generate focal points based on brightness profile
-    focal_points = generate_focal_points(brightness, shape, canvas_width, canvas_height)
+    if focal_template is None:
+        focal_template = _focal_arrays(_focal_table(brightness, shape))
+    focal_xy, focal_w = focal_template
+    focal_points = tuple(
+        FocalPoint(x, y, w) for (x, y), w in zip(focal_xy.tolist(), focal_w.tolist())
+    )
     
     # Determine visual flow
     visual_flow = determine_visual_flow(shape, geometry_data)
     
     # Calculate balance characteristics
-    balance = calculate_balance(shape, focal_points)
+    center_x, center_y = _center_of_mass(focal_xy, focal_w)
+    balance = _classify_balance(shape, center_x, center_y)
     
     # Determine spatial distribution
-    spatial_distribution = determine_spatial_distribution(shape, metadata.get('star_count_visual', 5))
+    spatial_distribution = determine_spatial_distribution(shape, meta.star_count)
     
     # Extract mythology themes
-    mythology_themes = []
+    mythology_themes: Tuple[str, ...] = ()
     if include_mythology:
-        mythology_themes = extract_mythology_themes(metadata)
+        mythology_themes = _mythology_themes(meta)
     
     # Generate suggested elements
-    suggested_elements = generate_suggested_elements(metadata, shape, brightness)
+    suggested_elements = _suggested_elements(meta)
     
     return CompositionParameters(
         focal_points=focal_points,
@@ -748,180 +1092,296 @@ def map_constellation_to_composition(
     )
 
 
-def generate_focal_points(
-    brightness: str,
-    shape: str,
-    width: int,
-    height: int
-) -> List[Dict[str, float]]:
-    """Generate focal point positions based on constellation brightness pattern."""
-    
+def _dispersed_points() -> Tuple[Tuple[float, float, float], ...]:
+    """Scattered pattern, drawn from a private RNG so the result is deterministic."""
+    rng = random.Random(42)
+    return tuple(
+        (0.2 + rng.random() * 0.6, 0.2 + rng.random() * 0.6, 0.2 + rng.random() * 0.2)
+        for _ in range(6)
+    )
+
+
+def _curved_sweep(num_points: int = 7) -> Tuple[Tuple[float, float, float], ...]:
+    """Curved sweep pattern: points along a half sine arc, heavier at the head."""
     points = []
-    
+    for i in range(num_points):
+        t = i / (num_points - 1)
+        x = 0.2 + 0.6 * t
+        y = 0.5 + 0.2 * math.sin(t * math.pi)
+        weight = 0.4 if i < 2 else 0.2
+        points.append((x, y, weight))
+    return tuple(points)
+
+
+# Focal point tables by pattern, as (x, y, weight) in normalized coordinates
+_FOCAL_TABLES: Dict[str, Tuple[Tuple[float, float, float], ...]] = {
+    # Gemini pattern - two equal focal points
+    'two_bright_stars': (
+        (0.35, 0.5, 0.5),
+        (0.65, 0.5, 0.5)
+    ),
+    # Sirius/Vega pattern - single dominant focal point
+    'extremely_bright_star': (
+        (0.5, 0.5, 1.0),
+        (0.35, 0.6, 0.2),
+        (0.65, 0.4, 0.2)
+    ),
+    # Cygnus pattern - cross focal points
+    'cross': (
+        (0.5, 0.5, 0.5),    # Center
+        (0.5, 0.3, 0.3),    # Top
+        (0.3, 0.5, 0.25),   # Left
+        (0.7, 0.5, 0.25),   # Right
+        (0.5, 0.7, 0.3)     # Bottom
+    ),
+    # Orion pattern - belt + shoulders/feet
+    'belt': (
+        (0.5, 0.45, 0.4),   # Belt center
+        (0.35, 0.3, 0.35),  # Left shoulder
+        (0.65, 0.3, 0.35),  # Right shoulder
+        (0.35, 0.7, 0.25),  # Left foot
+        (0.65, 0.7, 0.25)   # Right foot
+    ),
+    # Cassiopeia pattern - W shape
+    'w_zigzag': (
+        (0.2, 0.5, 0.25),
+        (0.35, 0.4, 0.25),
+        (0.5, 0.5, 0.25),
+        (0.65, 0.4, 0.25),
+        (0.8, 0.5, 0.25)
+    ),
+    # Ursa Major pattern - dipper bowl + handle
+    'dipper': (
+        (0.3, 0.45, 0.25),  # Bowl corner
+        (0.45, 0.45, 0.25), # Bowl corner
+        (0.45, 0.6, 0.25),  # Bowl corner
+        (0.3, 0.6, 0.25),   # Bowl corner
+        (0.55, 0.5, 0.2),   # Handle
+        (0.65, 0.45, 0.2),  # Handle
+        (0.75, 0.4, 0.2)    # Handle end
+    ),
+    # Pegasus pattern - great square
+    'square': (
+        (0.35, 0.35, 0.3),
+        (0.65, 0.35, 0.3),
+        (0.65, 0.65, 0.3),
+        (0.35, 0.65, 0.3)
+    ),
+    # Triangle pattern
+    'triangular': (
+        (0.5, 0.3, 0.4),
+        (0.35, 0.65, 0.35),
+        (0.65, 0.65, 0.35)
+    ),
+    # Scorpius pattern - curved sweep
+    'curved': _curved_sweep(),
+    # Scattered pattern
+    'dispersed': _dispersed_points(),
+    # Default: three-point composition
+    'default': (
+        (0.5, 0.35, 0.4),
+        (0.35, 0.65, 0.35),
+        (0.65, 0.65, 0.35)
+    )
+}
+
+
+def _classify_pattern(brightness: str, shape: str) -> str:
+    """Pick the focal point pattern for a brightness profile and shape."""
     if 'two_bright_stars' in brightness:
-        # Gemini pattern - two equal focal points
-        points = [
-            {'x': 0.35, 'y': 0.5, 'weight': 0.5},
-            {'x': 0.65, 'y': 0.5, 'weight': 0.5}
-        ]
+        return 'two_bright_stars'
     elif 'extremely_bright_star' in brightness:
-        # Sirius/Vega pattern - single dominant focal point
-        points = [
-            {'x': 0.5, 'y': 0.5, 'weight': 1.0},
-            {'x': 0.35, 'y': 0.6, 'weight': 0.2},
-            {'x': 0.65, 'y': 0.4, 'weight': 0.2}
-        ]
+        return 'extremely_bright_star'
     elif 'bright_cross' in brightness or 'cross' in shape:
-        # Cygnus pattern - cross focal points
-        points = [
-            {'x': 0.5, 'y': 0.5, 'weight': 0.5},   # Center
-            {'x': 0.5, 'y': 0.3, 'weight': 0.3},   # Top
-            {'x': 0.3, 'y': 0.5, 'weight': 0.25},  # Left
-            {'x': 0.7, 'y': 0.5, 'weight': 0.25},  # Right
-            {'x': 0.5, 'y': 0.7, 'weight': 0.3}    # Bottom
-        ]
+        return 'cross'
     elif 'belt' in shape or 'hourglass' in shape:
-        # Orion pattern - belt + shoulders/feet
-        points = [
-            {'x': 0.5, 'y': 0.45, 'weight': 0.4},  # Belt center
-            {'x': 0.35, 'y': 0.3, 'weight': 0.35}, # Left shoulder
-            {'x': 0.65, 'y': 0.3, 'weight': 0.35}, # Right shoulder
-            {'x': 0.35, 'y': 0.7, 'weight': 0.25}, # Left foot
-            {'x': 0.65, 'y': 0.7, 'weight': 0.25}  # Right foot
-        ]
+        return 'belt'
     elif 'w_zigzag' in shape:
-        # Cassiopeia pattern - W shape
-        points = [
-            {'x': 0.2, 'y': 0.5, 'weight': 0.25},
-            {'x': 0.35, 'y': 0.4, 'weight': 0.25},
-            {'x': 0.5, 'y': 0.5, 'weight': 0.25},
-            {'x': 0.65, 'y': 0.4, 'weight': 0.25},
-            {'x': 0.8, 'y': 0.5, 'weight': 0.25}
-        ]
+        return 'w_zigzag'
     elif 'dipper' in shape:
-        # Ursa Major pattern - dipper bowl + handle
-        points = [
-            {'x': 0.3, 'y': 0.45, 'weight': 0.25},  # Bowl corner
-            {'x': 0.45, 'y': 0.45, 'weight': 0.25}, # Bowl corner
-            {'x': 0.45, 'y': 0.6, 'weight': 0.25},  # Bowl corner
-            {'x': 0.3, 'y': 0.6, 'weight': 0.25},   # Bowl corner
-            {'x': 0.55, 'y': 0.5, 'weight': 0.2},   # Handle
-            {'x': 0.65, 'y': 0.45, 'weight': 0.2},  # Handle
-            {'x': 0.75, 'y': 0.4, 'weight': 0.2}    # Handle end
-        ]
+        return 'dipper'
     elif 'square' in shape:
-        # Pegasus pattern - great square
-        points = [
-            {'x': 0.35, 'y': 0.35, 'weight': 0.3},
-            {'x': 0.65, 'y': 0.35, 'weight': 0.3},
-            {'x': 0.65, 'y': 0.65, 'weight': 0.3},
-            {'x': 0.35, 'y': 0.65, 'weight': 0.3}
-        ]
+        return 'square'
     elif 'triangular' in shape:
-        # Triangle pattern
-        points = [
-            {'x': 0.5, 'y': 0.3, 'weight': 0.4},
-            {'x': 0.35, 'y': 0.65, 'weight': 0.35},
-            {'x': 0.65, 'y': 0.65, 'weight': 0.35}
-        ]
+        return 'triangular'
     elif 'curved' in shape or 'tail' in shape:
-        # Curved sweep pattern (Scorpius)
-        num_points = 7
-        for i in range(num_points):
-            t = i / (num_points - 1)
-            x = 0.2 + 0.6 * t
-            y = 0.5 + 0.2 * math.sin(t * math.pi)
-            weight = 0.4 if i < 2 else 0.2
-            points.append({'x': x, 'y': y, 'weight': weight})
+        return 'curved'
     elif 'dispersed' in shape:
-        # Scattered pattern
-        import random
-        random.seed(42)  # Deterministic
-        for i in range(6):
-            points.append({
-                'x': 0.2 + random.random() * 0.6,
-                'y': 0.2 + random.random() * 0.6,
-                'weight': 0.2 + random.random() * 0.2
-            })
+        return 'dispersed'
     else:
-        # Default: three-point composition
-        points = [
-            {'x': 0.5, 'y': 0.35, 'weight': 0.4},
-            {'x': 0.35, 'y': 0.65, 'weight': 0.35},
-            {'x': 0.65, 'y': 0.65, 'weight': 0.35}
-        ]
-    
-    return points
+        return 'default'
 
 
-def determine_visual_flow(shape: str, geometry_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-    """Determine directional flow and movement patterns."""
-    
-    if 'cascade' in shape or 'dispersed_cascade' in shape:
-        return {
-            'primary_direction': 'downward',
-            'flow_type': 'cascading',
-            'movement_quality': 'fluid, dispersing',
-            'rhythm': 'irregular, natural flow'
-        }
-    elif 'wings' in shape or 'symmetric' in shape:
-        return {
-            'primary_direction': 'horizontal',
-            'flow_type': 'bilateral',
-            'movement_quality': 'balanced, expansive',
-            'rhythm': 'symmetrical'
-        }
-    elif 'curved' in shape or 'tail' in shape:
-        return {
-            'primary_direction': 'curved sweep',
-            'flow_type': 'sinuous',
-            'movement_quality': 'dynamic, flowing',
-            'rhythm': 'continuous curve'
-        }
-    elif 'cross' in shape:
-        return {
-            'primary_direction': 'radial',
-            'flow_type': 'centered',
-            'movement_quality': 'stable, anchored',
-            'rhythm': 'four-way symmetry'
-        }
-    elif 'linear' in shape or 'belt' in shape:
-        return {
-            'primary_direction': 'horizontal',
-            'flow_type': 'linear',
-            'movement_quality': 'direct, purposeful',
-            'rhythm': 'regular spacing'
-        }
-    elif 'zigzag' in shape or 'w_' in shape:
-        return {
-            'primary_direction': 'alternating',
-            'flow_type': 'zigzag',
-            'movement_quality': 'energetic, angular',
-            'rhythm': 'rhythmic alternation'
-        }
-    elif 'dipper' in shape:
-        return {
-            'primary_direction': 'L-shaped',
-            'flow_type': 'segmented',
-            'movement_quality': 'contained then extending',
-            'rhythm': 'bowl to handle transition'
-        }
-    else:
-        return {
-            'primary_direction': 'multi-directional',
-            'flow_type': 'balanced',
-            'movement_quality': 'stable',
-            'rhythm': 'varied'
-        }
+def _focal_table(brightness: str, shape: str) -> Tuple[Tuple[float, float, float], ...]:
+    """Focal points as (x, y, weight) tuples for a brightness profile and shape."""
+    return _FOCAL_TABLES[_classify_pattern(brightness, shape)]
+
+
+def generate_focal_points(
+    brightness: str,
+    shape: str,
+    width: int,
+    height: int
+) -> List[Dict[str, float]]:
+    """Generate focal point positions based on constellation brightness pattern."""
+    return [{'x': x, 'y': y, 'weight': w} for x, y, w in _focal_table(brightness, shape)]
+
+
+def _focal_arrays(
+    table: Sequence[Tuple[float, float, float]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Split (x, y, weight) tuples into read-only (N, 2) positions and (N,) weights."""
+    arr = np.array(table, dtype=np.float64).reshape(-1, 3)
+    focal_xy = np.ascontiguousarray(arr[:, :2])
+    focal_w = np.ascontiguousarray(arr[:, 2])
+    focal_xy.setflags(write=False)
+    focal_w.setflags(write=False)
+    return focal_xy, focal_w
+
+
+# Focal point templates per catalogue constellation, in normalized [0, 1]
+# coordinates. They depend only on the constellation, so evaluate them once.
+_TEMPLATES: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+    name: _focal_arrays(_focal_table(data['brightness_profile'], data['shape']))
+    for name, data in CONSTELLATIONS.items()
+}
+
+
+_FLOW_CASCADING = VisualFlow(
+    primary_direction='downward',
+    flow_type='cascading',
+    movement_quality='fluid, dispersing',
+    rhythm='irregular, natural flow'
+)
+_FLOW_BILATERAL = VisualFlow(
+    primary_direction='horizontal',
+    flow_type='bilateral',
+    movement_quality='balanced, expansive',
+    rhythm='symmetrical'
+)
+_FLOW_SINUOUS = VisualFlow(
+    primary_direction='curved sweep',
+    flow_type='sinuous',
+    movement_quality='dynamic, flowing',
+    rhythm='continuous curve'
+)
+_FLOW_CENTERED = VisualFlow(
+    primary_direction='radial',
+    flow_type='centered',
+    movement_quality='stable, anchored',
+    rhythm='four-way symmetry'
+)
+_FLOW_LINEAR = VisualFlow(
+    primary_direction='horizontal',
+    flow_type='linear',
+    movement_quality='direct, purposeful',
+    rhythm='regular spacing'
+)
+_FLOW_ZIGZAG = VisualFlow(
+    primary_direction='alternating',
+    flow_type='zigzag',
+    movement_quality='energetic, angular',
+    rhythm='rhythmic alternation'
+)
+_FLOW_SEGMENTED = VisualFlow(
+    primary_direction='L-shaped',
+    flow_type='segmented',
+    movement_quality='contained then extending',
+    rhythm='bowl to handle transition'
+)
+_FLOW_DEFAULT = VisualFlow(
+    primary_direction='multi-directional',
+    flow_type='balanced',
+    movement_quality='stable',
+    rhythm='varied'
+)
+
+# Shape substring -> flow, checked in priority order
+_FLOW_BY_TOKEN: Dict[str, VisualFlow] = {
+    'cascade': _FLOW_CASCADING,
+    'wings': _FLOW_BILATERAL,
+    'symmetric': _FLOW_BILATERAL,
+    'curved': _FLOW_SINUOUS,
+    'tail': _FLOW_SINUOUS,
+    'cross': _FLOW_CENTERED,
+    'linear': _FLOW_LINEAR,
+    'belt': _FLOW_LINEAR,
+    'zigzag': _FLOW_ZIGZAG,
+    'w_': _FLOW_ZIGZAG,
+    'dipper': _FLOW_SEGMENTED
+}
+_FLOW_PRIORITY = tuple(_FLOW_BY_TOKEN)
+
+
+def determine_visual_flow(shape: str, geometry_data: Optional[Dict[str, Any]]) -> VisualFlow:
+    """
+    Determine directional flow and movement patterns.
+
+    Returns one of the shared, immutable VisualFlow constants above.
+    """
+    for token in _FLOW_PRIORITY:
+        if token in shape:
+            return _FLOW_BY_TOKEN[token]
+    return _FLOW_DEFAULT
 
 
-def calculate_balance(shape: str, focal_points: List[Dict[str, float]]) -> Dict[str, Any]:
+def calculate_balance(shape: str, focal_points: List[Dict[str, float]]) -> Balance:
     """Calculate visual balance characteristics."""
-    
-    # Calculate center of mass
-    total_weight = sum(p['weight'] for p in focal_points)
-    center_x = sum(p['x'] * p['weight'] for p in focal_points) / total_weight
-    center_y = sum(p['y'] * p['weight'] for p in focal_points) / total_weight
+    focal_xy, focal_w = _focal_arrays(
+        [(p['x'], p['y'], p['weight']) for p in focal_points]
+    )
+    center_x, center_y = _center_of_mass(focal_xy, focal_w)
+    return _classify_balance(shape, center_x, center_y)
+
+
+# With the optional numba dependency (the "jit" extra) the centroid runs as a
+# compiled loop. Importing numba and compiling are deferred to the first call,
+# a composition cache miss, so server start-up does not pay for them.
+# String-heavy helpers stay in Python, where numba would only fall back to
+# object mode.
+_JIT_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _center_of_mass(focal_xy: np.ndarray, focal_w: np.ndarray) -> Tuple[float, float]:
+    """Weighted centroid of (N, 2) focal positions with (N,) weights."""
+    if _JIT_AVAILABLE:
+        center_x, center_y = _jit_weighted_centroid()(focal_xy, focal_w)
+        return center_x, center_y
+    total_weight = focal_w.sum()
+    center_x, center_y = ((focal_xy * focal_w[:, None]).sum(axis=0) / total_weight).tolist()
+    return center_x, center_y
+
+
+def _weighted_centroid(focal_xy: np.ndarray, focal_w: np.ndarray) -> Tuple[float, float]:
+    """Loop form of _center_of_mass, summing in the same order, for JIT compilation."""
+    total_weight = 0.0
+    sum_x = 0.0
+    sum_y = 0.0
+    for i in range(focal_w.shape[0]):
+        weight = focal_w[i]
+        total_weight += weight
+        sum_x += focal_xy[i, 0] * weight
+        sum_y += focal_xy[i, 1] * weight
+    return sum_x / total_weight, sum_y / total_weight
+
+
+@lru_cache(maxsize=1)
+def _jit_weighted_centroid() -> Callable[[np.ndarray, np.ndarray], Tuple[float, float]]:
+    """_weighted_centroid compiled for the read-only float64 arrays from _focal_arrays."""
+    from numba import njit, types as nb_types
+
+    compiled: Callable[[np.ndarray, np.ndarray], Tuple[float, float]] = njit(
+        nb_types.UniTuple(nb_types.float64, 2)(
+            nb_types.Array(nb_types.float64, 2, 'C', readonly=True),
+            nb_types.Array(nb_types.float64, 1, 'C', readonly=True),
+        ),
+        cache=True,
+    )(_weighted_centroid)
+    return compiled
+
+
+def _classify_balance(shape: str, center_x: float, center_y: float) -> Balance:
+    """Describe visual balance from the focal points' center of mass."""
     
     # Determine balance type
     if abs(center_x - 0.5) < 0.1 and abs(center_y - 0.5) < 0.1:
@@ -936,24 +1396,34 @@ def calculate_balance(shape: str, focal_points: List[Dict[str, float]]) -> Dict[
     # Check symmetry
     is_symmetric = 'symmetric' in shape or 'cross' in shape or 'square' in shape
     
-    return {
-        'balance_type': balance_type,
-        'center_of_mass': {'x': center_x, 'y': center_y},
-        'symmetry': 'symmetric' if is_symmetric else 'asymmetric',
-        'stability': 'high' if balance_type == 'centered' else 'dynamic'
-    }
+    return Balance(
+        balance_type=balance_type,
+        center_of_mass=CenterOfMass(x=center_x, y=center_y),
+        symmetry='symmetric' if is_symmetric else 'asymmetric',
+        stability='high' if balance_type == 'centered' else 'dynamic'
+    )
+
+
+# Shape substring -> spatial distribution, checked in priority order before
+# falling back to the star count
+_SPATIAL_BY_TOKEN: Dict[str, str] = {
+    'compact': 'clustered_central',
+    'dispersed': 'scattered_wide',
+    'cascade': 'scattered_wide',
+    'linear': 'linear_arrangement',
+    'belt': 'linear_arrangement'
+}
+_SPATIAL_PRIORITY = tuple(_SPATIAL_BY_TOKEN)
 
 
 def determine_spatial_distribution(shape: str, star_count: int) -> str:
     """Determine how elements spread across frame."""
     
-    if 'compact' in shape:
-        return 'clustered_central'
-    elif 'dispersed' in shape or 'cascade' in shape:
-        return 'scattered_wide'
-    elif 'linear' in shape or 'belt' in shape:
-        return 'linear_arrangement'
-    elif star_count <= 5:
+    for token in _SPATIAL_PRIORITY:
+        if token in shape:
+            return _SPATIAL_BY_TOKEN[token]
+    
+    if star_count <= 5:
         return 'minimal_sparse'
     elif star_count >= 10:
         return 'complex_dense'
@@ -961,163 +1431,262 @@ def determine_spatial_distribution(shape: str, star_count: int) -> str:
         return 'moderate_distributed'
 
 
-def extract_mythology_themes(metadata: Dict[str, Any]) -> List[str]:
+# Keyword rule tables: (trigger substrings, result). Story themes collect every
+# matching rule; suggestion tables take the first match, else the default.
+_STORY_THEME_RULES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (('rescue', 'save'), 'heroic rescue'),
+    (('hunt', 'prey'), 'the hunt'),
+    (('transform',), 'transformation'),
+    (('death', 'kill', 'slay'), 'mortality'),
+    (('eternal', 'immortal'), 'eternity'),
+    (('love',), 'love and loss'),
+    (('wisdom', 'teacher'), 'wisdom'),
+    (('punishment',), 'divine punishment')
+)
+
+# Subjects keyed by story keywords
+_SUBJECT_TABLE: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (('hunt',), ('figures in pursuit', 'dynamic poses', 'animals', 'weapons')),
+    (('rescue',), ('hero and victim', 'chains or bonds', 'triumphant pose')),
+    (('music', 'lyre'), ('musical instruments', 'flowing fabric', 'contemplative pose')),
+    (('wisdom',), ('scroll or book', 'teaching gesture', 'attentive students'))
+)
+_DEFAULT_SUBJECTS = ('primary figure', 'supporting elements', 'narrative props')
+
+# Lighting keyed by brightness profile
+_LIGHTING_TABLE: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (('extremely_bright',), ('dramatic key light', 'high contrast', 'star-like highlights', 'radiating glow')),
+    (('two_bright',), ('dual light sources', 'balanced illumination', 'twin highlights')),
+    (('bright_cross',), ('four-point lighting', 'symmetrical illumination', 'centered highlight'))
+)
+_DEFAULT_LIGHTING = ('even lighting', 'gentle highlights', 'soft shadows')
+
+# Atmosphere keyed by shape
+_ATMOSPHERE_TABLE: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (('cascade',), ('flowing mist', 'falling elements', 'vertical movement')),
+    (('curved', 'tail'), ('swirling smoke', 'curved lines', 'dynamic energy')),
+    (('symmetric', 'cross'), ('balanced composition', 'architectural elements', 'formal symmetry'))
+)
+_DEFAULT_ATMOSPHERE = ('natural environment', 'organic forms', 'irregular shapes')
+
+# Color palette keyed by theme keywords
+_PALETTE_TABLE: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (('water', 'flow'), ('blues', 'teals', 'silver', 'flowing gradients')),
+    (('fire', 'power'), ('reds', 'oranges', 'golds', 'warm tones')),
+    (('death', 'darkness'), ('deep purples', 'blacks', 'dark blues', 'somber tones')),
+    (('wisdom', 'healing'), ('greens', 'soft golds', 'earth tones', 'balanced hues'))
+)
+_DEFAULT_PALETTE = ('starlight whites', 'night sky blues', 'cosmic purples', 'celestial palette')
+
+
+def _first_rule(text: str, table: Tuple[Tuple[Tuple[str, ...], Any], ...], default: Any) -> Any:
+    """Result of the first rule with a keyword contained in text."""
+    for keywords, result in table:
+        for keyword in keywords:
+            if keyword in text:
+                return result
+    return default
+
+
+def extract_mythology_themes(metadata: Mapping[str, Any]) -> List[str]:
     """Extract key themes from constellation mythology."""
-    
-    story = metadata.get('story', '').lower()
-    theme = metadata.get('theme', '').lower()
-    
-    themes = []
-    
-    # Parse explicit theme
-    if theme:
-        themes.extend([t.strip() for t in theme.split(',')])
+    return list(_mythology_themes(_const_meta(metadata)))
+
+
+def _mythology_themes(meta: _ConstMeta) -> Tuple[str, ...]:
+    """Explicit theme tokens followed by themes implied by the story."""
+    themes = list(meta.theme_tokens)
     
     # Add implied themes from story
-    if 'rescue' in story or 'save' in story:
-        themes.append('heroic rescue')
-    if 'hunt' in story or 'prey' in story:
-        themes.append('the hunt')
-    if 'transform' in story:
-        themes.append('transformation')
-    if 'death' in story or 'kill' in story or 'slay' in story:
-        themes.append('mortality')
-    if 'eternal' in story or 'immortal' in story:
-        themes.append('eternity')
-    if 'love' in story:
-        themes.append('love and loss')
-    if 'wisdom' in story or 'teacher' in story:
-        themes.append('wisdom')
-    if 'punishment' in story:
-        themes.append('divine punishment')
+    for keywords, implied in _STORY_THEME_RULES:
+        for keyword in keywords:
+            if keyword in meta.story_lower:
+                themes.append(implied)
+                break
     
-    return themes[:5]  # Limit to top 5
+    return tuple(themes[:5])  # Limit to top 5
 
 
 def generate_suggested_elements(
-    metadata: Dict[str, Any],
+    metadata: Mapping[str, Any],
     shape: str,
     brightness: str
-) -> Dict[str, List[str]]:
+) -> SuggestedElements:
     """Generate concrete visual element suggestions."""
-    
-    suggestions = {
-        'subjects': [],
-        'lighting': [],
-        'atmosphere': [],
-        'color_palette': []
-    }
-    
-    # Subject suggestions based on story
-    story = metadata.get('story', '').lower()
-    if 'hunt' in story:
-        suggestions['subjects'] = ['figures in pursuit', 'dynamic poses', 'animals', 'weapons']
-    elif 'rescue' in story:
-        suggestions['subjects'] = ['hero and victim', 'chains or bonds', 'triumphant pose']
-    elif 'music' in story or 'lyre' in story:
-        suggestions['subjects'] = ['musical instruments', 'flowing fabric', 'contemplative pose']
-    elif 'wisdom' in story:
-        suggestions['subjects'] = ['scroll or book', 'teaching gesture', 'attentive students']
-    else:
-        suggestions['subjects'] = ['primary figure', 'supporting elements', 'narrative props']
-    
-    # Lighting based on brightness
-    if 'extremely_bright' in brightness:
-        suggestions['lighting'] = ['dramatic key light', 'high contrast', 'star-like highlights', 'radiating glow']
-    elif 'two_bright' in brightness:
-        suggestions['lighting'] = ['dual light sources', 'balanced illumination', 'twin highlights']
-    elif 'bright_cross' in brightness:
-        suggestions['lighting'] = ['four-point lighting', 'symmetrical illumination', 'centered highlight']
-    else:
-        suggestions['lighting'] = ['even lighting', 'gentle highlights', 'soft shadows']
-    
-    # Atmosphere based on shape
-    if 'cascade' in shape:
-        suggestions['atmosphere'] = ['flowing mist', 'falling elements', 'vertical movement']
-    elif 'curved' in shape or 'tail' in shape:
-        suggestions['atmosphere'] = ['swirling smoke', 'curved lines', 'dynamic energy']
-    elif 'symmetric' in shape or 'cross' in shape:
-        suggestions['atmosphere'] = ['balanced composition', 'architectural elements', 'formal symmetry']
-    else:
-        suggestions['atmosphere'] = ['natural environment', 'organic forms', 'irregular shapes']
-    
-    # Color palette suggestions
-    theme = metadata.get('theme', '').lower()
-    if 'water' in theme or 'flow' in theme:
-        suggestions['color_palette'] = ['blues', 'teals', 'silver', 'flowing gradients']
-    elif 'fire' in theme or 'power' in theme:
-        suggestions['color_palette'] = ['reds', 'oranges', 'golds', 'warm tones']
-    elif 'death' in theme or 'darkness' in theme:
-        suggestions['color_palette'] = ['deep purples', 'blacks', 'dark blues', 'somber tones']
-    elif 'wisdom' in theme or 'healing' in theme:
-        suggestions['color_palette'] = ['greens', 'soft golds', 'earth tones', 'balanced hues']
-    else:
-        suggestions['color_palette'] = ['starlight whites', 'night sky blues', 'cosmic purples', 'celestial palette']
-    
-    return suggestions
+    meta = _const_meta(metadata)
+    return _suggested_elements(
+        msgspec.structs.replace(meta, shape=shape, brightness=brightness)
+    )
+
+
+def _suggested_elements(meta: _ConstMeta) -> SuggestedElements:
+    """Suggested subjects, lighting, atmosphere and palette from normalized metadata."""
+    return SuggestedElements(
+        subjects=_first_rule(meta.story_lower, _SUBJECT_TABLE, _DEFAULT_SUBJECTS),
+        lighting=_first_rule(meta.brightness, _LIGHTING_TABLE, _DEFAULT_LIGHTING),
+        atmosphere=_first_rule(meta.shape, _ATMOSPHERE_TABLE, _DEFAULT_ATMOSPHERE),
+        color_palette=_first_rule(meta.theme_lower, _PALETTE_TABLE, _DEFAULT_PALETTE)
+    )
+
+
+# Field titles for the markdown sections, derived once from the struct fields
+_FLOW_FIELD_TITLES = tuple(
+    (key, key.replace('_', ' ').title()) for key in VisualFlow.__struct_fields__
+)
+_ELEMENT_FIELD_TITLES = tuple(
+    (key, key.replace('_', ' ').title()) for key in SuggestedElements.__struct_fields__
+)
 
 
 def format_composition_markdown(
     constellation_name: str,
-    metadata: Dict[str, Any],
+    metadata: Mapping[str, Any],
     params: CompositionParameters
 ) -> str:
     """Format composition parameters as markdown."""
     
-    md = f"# Constellation Composition: {constellation_name}\n\n"
-    
-    md += f"**Story:** {metadata.get('story', 'N/A')}\n\n"
-    md += f"**Themes:** {metadata.get('theme', 'N/A')}\n\n"
-    md += f"**Visual Character:** {metadata.get('visual_character', 'N/A')}\n\n"
-    
-    md += "## Focal Points\n\n"
+    parts: List[str] = [
+        f"# Constellation Composition: {constellation_name}\n\n",
+        f"**Story:** {metadata.get('story', 'N/A')}\n\n",
+        f"**Themes:** {metadata.get('theme', 'N/A')}\n\n",
+        f"**Visual Character:** {metadata.get('visual_character', 'N/A')}\n\n",
+        "## Focal Points\n\n",
+    ]
     for i, point in enumerate(params.focal_points, 1):
-        md += f"{i}. Position: ({point['x']:.2f}, {point['y']:.2f}) - Weight: {point['weight']:.2f}\n"
-    
-    md += "\n## Visual Flow\n\n"
-    for key, value in params.visual_flow.items():
-        md += f"- **{key.replace('_', ' ').title()}:** {value}\n"
-    
-    md += "\n## Balance\n\n"
-    md += f"- **Type:** {params.balance['balance_type']}\n"
-    md += f"- **Center of Mass:** ({params.balance['center_of_mass']['x']:.2f}, {params.balance['center_of_mass']['y']:.2f})\n"
-    md += f"- **Symmetry:** {params.balance['symmetry']}\n"
-    md += f"- **Stability:** {params.balance['stability']}\n"
+        parts.append(f"{i}. Position: ({point.x:.2f}, {point.y:.2f}) - Weight: {point.weight:.2f}\n")
+    
+    parts.append("\n## Visual Flow\n\n")
+    for key, title in _FLOW_FIELD_TITLES:
+        parts.append(f"- **{title}:** {getattr(params.visual_flow, key)}\n")
+    
+    balance = params.balance
+    parts.append(
+        "\n## Balance\n\n"
+        f"- **Type:** {balance.balance_type}\n"
+        f"- **Center of Mass:** ({balance.center_of_mass.x:.2f}, {balance.center_of_mass.y:.2f})\n"
+        f"- **Symmetry:** {balance.symmetry}\n"
+        f"- **Stability:** {balance.stability}\n"
+    )
     
-    md += f"\n## Spatial Distribution\n\n"
-    md += f"{params.spatial_distribution.replace('_', ' ').title()}\n"
+    parts.append(
+        "\n## Spatial Distribution\n\n"
+        f"{params.spatial_distribution.replace('_', ' ').title()}\n"
+    )
     
     if params.mythology_themes:
-        md += f"\n## Mythology Themes\n\n"
+        parts.append("\n## Mythology Themes\n\n")
         for theme in params.mythology_themes:
-            md += f"- {theme.title()}\n"
+            parts.append(f"- {theme.title()}\n")
     
-    md += "\n## Suggested Visual Elements\n\n"
-    for category, elements in params.suggested_elements.items():
-        md += f"### {category.replace('_', ' ').title()}\n\n"
-        for elem in elements:
-            md += f"- {elem}\n"
-        md += "\n"
+    parts.append("\n## Suggested Visual Elements\n\n")
+    for category, title in _ELEMENT_FIELD_TITLES:
+        parts.append(f"### {title}\n\n")
+        for elem in getattr(params.suggested_elements, category):
+            parts.append(f"- {elem}\n")
+        parts.append("\n")
     
-    return md
+    return ''.join(parts)
 
 
 def format_search_results_markdown(results: List[Dict[str, Any]]) -> str:
     """Format constellation search results as markdown."""
     
-    md = f"# Found {len(results)} Constellation(s)\n\n"
+    parts: List[str] = [f"# Found {len(results)} Constellation(s)\n\n"]
     
     for i, result in enumerate(results, 1):
-        md += f"## {i}. {result['name']}\n\n"
-        md += f"**Abbreviation:** {result['abbr']}\n\n"
-        md += f"**Story:** {result['story']}\n\n"
-        md += f"**Themes:** {result['theme']}\n\n"
-        md += f"**Visual Character:** {result['visual_character']}\n\n"
-        md += f"**Shape:** {result['shape'].replace('_', ' ').title()}\n\n"
-        md += f"**Brightness:** {result['brightness_profile'].replace('_', ' ').title()}\n\n"
-        md += "---\n\n"
+        parts.append(
+            f"## {i}. {result['name']}\n\n"
+            f"**Abbreviation:** {result['abbr']}\n\n"
+            f"**Story:** {result['story']}\n\n"
+            f"**Themes:** {result['theme']}\n\n"
+            f"**Visual Character:** {result['visual_character']}\n\n"
+            f"**Shape:** {result['shape'].replace('_', ' ').title()}\n\n"
+            f"**Brightness:** {result['brightness_profile'].replace('_', ' ').title()}\n\n"
+            "---\n\n"
+        )
+    
+    return ''.join(parts)
+
+
+def _render_composition_response(
+    constellation_name: str,
+    composition: CompositionParameters,
+    canvas_width: int,
+    canvas_height: int,
+    response_format: ResponseFormat,
+    geometry_data: Optional[Dict[str, Any]] = None
+) -> str:
+    """Format a composition for generate_constellation_composition."""
+    metadata = CONSTELLATIONS[constellation_name]
+    
+    if response_format == "json":
+        result = {
+            'constellation': constellation_name,
+            'abbreviation': metadata['abbr'],
+            'canvas': {
+                'width': canvas_width,
+                'height': canvas_height
+            },
+            'composition': composition
+        }
+        if geometry_data is not None:
+            result['geometry'] = geometry_data
+        return _dumps(result)
+    else:
+        return format_composition_markdown(constellation_name, metadata, composition)
+
+
+@lru_cache(maxsize=512)
+def _cached_composition_response(
+    constellation_name: str,
+    canvas_width: int,
+    canvas_height: int,
+    include_mythology: bool,
+    response_format: ResponseFormat
+) -> str:
+    """Memoized tool response for a catalogue constellation (no geometry data)."""
+    composition = _cached_composition(
+        constellation_name, canvas_width, canvas_height, include_mythology
+    )
+    return _render_composition_response(
+        constellation_name, composition, canvas_width, canvas_height, response_format
+    )
+
+
+def _render_constellation_list(response_format: ResponseFormat) -> str:
+    """Format the full catalogue for list_all_constellations."""
+    constellation_list: List[Dict[str, Any]] = []
+    for name, data in _SORTED_CONSTELLATION_ITEMS:
+        constellation_list.append({
+            'name': name,
+            'abbreviation': data.get('abbr'),
+            'theme': data.get('theme'),
+            'shape': data.get('shape')
+        })
     
-    return md
+    if response_format == "json":
+        return _dumps({
+            'constellations': constellation_list,
+            'total_count': len(constellation_list)
+        })
+    else:
+        parts: List[str] = [f"# Available Constellations ({len(constellation_list)})\n\n"]
+        for item in constellation_list:
+            parts.append(
+                f"## {item['name']} ({item['abbreviation']})\n\n"
+                f"**Theme:** {item['theme']}\n\n"
+                f"**Shape Pattern:** {item['shape'].replace('_', ' ').title()}\n\n"
+                "---\n\n"
+            )
+        return ''.join(parts)
+
+
+# The catalogue is static, so both list_all_constellations responses and the
+# "available constellations" hint are rendered once at import.
+_LIST_RESPONSES = MappingProxyType({
+    fmt: _render_constellation_list(fmt) for fmt in ("markdown", "json")
+})
+_AVAILABLE_LIST = ', '.join(name for name, _ in _SORTED_CONSTELLATION_ITEMS)
 
 
 # ============================================================================
@@ -1345,48 +1914,46 @@ async def search_constellations(params: ConstellationSearchInput) -> str:
         str: List of matching constellations with their characteristics
     """
     
+    query_lower = params.query.strip().lower() if params.query else None
+    
+    # Resolve the category filters to row sets first; they are cheap and
+    # usually the most selective, so fewer rows reach the text scan
+    shape_rows = (
+        _category_rows('shape', params.shape_type.strip().lower()) if params.shape_type else None
+    )
+    brightness_rows = (
+        _category_rows('brightness', params.brightness.strip().lower())
+        if params.brightness else None
+    )
+    
     results = []
     
-    for name, data in CONSTELLATIONS.items():
-        match = True
-        
-        # Text query matching
-        if params.query:
-            query_lower = params.query.lower()
-            searchable = f"{name} {data.get('story', '')} {data.get('theme', '')} {data.get('visual_character', '')}".lower()
-            if query_lower not in searchable:
-                match = False
-        
-        # Shape filter
-        if params.shape_type and match:
-            shape = data.get('shape', '')
-            if params.shape_type.lower() not in shape.lower():
-                match = False
+    for i, name in enumerate(NAMES):
+        if shape_rows is not None and i not in shape_rows:
+            continue
+        if brightness_rows is not None and i not in brightness_rows:
+            continue
         
-        # Brightness filter
-        if params.brightness and match:
-            brightness = data.get('brightness_profile', '')
-            if params.brightness.lower() not in brightness.lower():
-                match = False
+        # Text query matching against the prebuilt lower-cased index
+        if query_lower is not None and query_lower not in _SEARCH_INDEX[i]:
+            continue
         
-        if match:
-            result = {
-                'name': name,
-                'abbr': data.get('abbr'),
-                'story': data.get('story'),
-                'theme': data.get('theme'),
-                'visual_character': data.get('visual_character'),
-                'shape': data.get('shape'),
-                'brightness_profile': data.get('brightness_profile'),
-                'star_count': data.get('star_count_visual')
-            }
-            results.append(result)
+        results.append({
+            'name': name,
+            'abbr': ABBRS[i],
+            'story': STORIES[i],
+            'theme': THEMES[i],
+            'visual_character': VIS_CHAR[i],
+            'shape': SHAPES[i],
+            'brightness_profile': BRIGHTNESS[i],
+            'star_count': STAR_COUNTS[i]
+        })
     
     if not results:
         return "No constellations found matching your criteria. Try broader search terms."
     
-    if params.response_format == ResponseFormat.JSON:
-        return json.dumps({'constellations': results, 'count': len(results)}, indent=2)
+    if params.response_format == "json":
+        return _dumps({'constellations': results, 'count': len(results)})
     else:
         return format_search_results_markdown(results)
 
@@ -1418,6 +1985,7 @@ async def generate_constellation_composition(params: ConstellationCompositionInp
             - canvas_width: Target canvas width in pixels (512-4096)
             - canvas_height: Target canvas height in pixels (512-4096)
             - include_mythology: Include mythological themes (boolean)
+            - include_geometry: Fetch star-line GeoJSON for JSON output (boolean)
             - response_format: Output format (json or markdown)
     
     Returns:
@@ -1428,44 +1996,46 @@ async def generate_constellation_composition(params: ConstellationCompositionInp
             - spatial_distribution: How elements spread across frame
             - mythology_themes: Key thematic elements from constellation story
             - suggested_elements: Concrete suggestions for subjects, lighting, atmosphere, colors
+            - geometry: Star-line GeoJSON feature (JSON only, when requested and available)
     """
     
     # Find constellation in database
     constellation_name = params.constellation_name
     if constellation_name not in CONSTELLATIONS:
-        available = ', '.join(sorted(CONSTELLATIONS.keys()))
-        return f"Error: Constellation '{constellation_name}' not found. Available constellations: {available}"
-    
-    metadata = CONSTELLATIONS[constellation_name]
-    abbr = metadata['abbr']
-    
-    # Attempt to fetch real geometry data (optional enhancement)
-    geometry_data = await fetch_constellation_data(abbr)
+        return f"Error: Constellation '{constellation_name}' not found. Available constellations: {_AVAILABLE_LIST}"
+    
+    # Fields are Optional in the schema; an explicit null means the default size
+    canvas_width = params.canvas_width if params.canvas_width is not None else 1024
+    canvas_height = params.canvas_height if params.canvas_height is not None else 1024
+    
+    # The composition does not depend on geometry, so the response is served
+    # from the cache and the network is only touched when the JSON response
+    # will carry the geometry
+    if not (params.include_geometry and params.response_format == "json"):
+        return _cached_composition_response(
+            constellation_name,
+            canvas_width,
+            canvas_height,
+            params.include_mythology,
+            params.response_format
+        )
     
-    # Generate composition parameters (deterministic, zero-LLM-cost)
-    composition = map_constellation_to_composition(
-        constellation_name=constellation_name,
-        metadata=metadata,
-        geometry_data=geometry_data,
-        canvas_width=params.canvas_width,
-        canvas_height=params.canvas_height,
-        include_mythology=params.include_mythology
+    geometry_data = await fetch_constellation_data(CONSTELLATIONS[constellation_name]['abbr'])
+    composition = _cached_composition(
+        constellation_name,
+        canvas_width,
+        canvas_height,
+        params.include_mythology
     )
     
-    # Format response
-    if params.response_format == ResponseFormat.JSON:
-        result = {
-            'constellation': constellation_name,
-            'abbreviation': abbr,
-            'canvas': {
-                'width': params.canvas_width,
-                'height': params.canvas_height
-            },
-            'composition': composition.model_dump()
-        }
-        return json.dumps(result, indent=2)
-    else:
-        return format_composition_markdown(constellation_name, metadata, composition)
+    return _render_composition_response(
+        constellation_name,
+        composition,
+        canvas_width,
+        canvas_height,
+        params.response_format,
+        geometry_data
+    )
 
 
 @mcp.tool(
@@ -1478,7 +2048,7 @@ async def generate_constellation_composition(params: ConstellationCompositionInp
         "openWorldHint": False
     }
 )
-async def list_all_constellations(response_format: ResponseFormat = ResponseFormat.MARKDOWN) -> str:
+async def list_all_constellations(response_format: ResponseFormat = "markdown") -> str:
     """
     List all available constellations with basic information.
     
@@ -1493,28 +2063,7 @@ async def list_all_constellations(response_format: ResponseFormat = ResponseForm
         str: Complete list of constellations with basic metadata
     """
     
-    constellation_list = []
-    for name, data in sorted(CONSTELLATIONS.items()):
-        constellation_list.append({
-            'name': name,
-            'abbreviation': data.get('abbr'),
-            'theme': data.get('theme'),
-            'shape': data.get('shape')
-        })
-    
-    if response_format == ResponseFormat.JSON:
-        return json.dumps({
-            'constellations': constellation_list,
-            'total_count': len(constellation_list)
-        }, indent=2)
-    else:
-        md = f"# Available Constellations ({len(constellation_list)})\n\n"
-        for item in constellation_list:
-            md += f"## {item['name']} ({item['abbreviation']})\n\n"
-            md += f"**Theme:** {item['theme']}\n\n"
-            md += f"**Shape Pattern:** {item['shape'].replace('_', ' ').title()}\n\n"
-            md += "---\n\n"
-        return md
+    return _LIST_RESPONSES.get(response_format, _LIST_RESPONSES["markdown"])
 
 
 # ============================================================================
@@ -1587,7 +2136,7 @@ async def get_server_info() -> str:
                       "get_constellation_domain_registry_config"]
         }
     }
-    return json.dumps(info, indent=2)
+    return _dumps(info)
 
 
 @mcp.tool(
@@ -1602,7 +2151,7 @@ async def get_server_info() -> str:
 )
 async def get_constellation_coordinates(
     name: str,
-    response_format: ResponseFormat = ResponseFormat.JSON
+    response_format: ResponseFormat = "json"
 ) -> str:
     """
     Extract normalized 5D parameter coordinates for a canonical state or
@@ -1634,23 +2183,15 @@ async def get_constellation_coordinates(
         }
     else:
         # Try to match constellation name to nearest canonical state
-        target_name = None
-        for cname in CONSTELLATIONS:
-            if name.lower() == cname.lower():
-                target_name = cname
-                break
-            if name.lower() == CONSTELLATIONS[cname]['abbr'].lower():
-                target_name = cname
-                break
+        target_name = _NAME_LOOKUP.get(name.casefold())
 
         if not target_name:
             available_states = ", ".join(sorted(CONSTELLATION_CANONICAL_STATES.keys()))
-            available_const = ", ".join(sorted(CONSTELLATIONS.keys()))
-            return json.dumps({
+            return _dumps({
                 "error": f"'{name}' not found",
                 "available_canonical_states": available_states,
-                "available_constellations": available_const
-            }, indent=2)
+                "available_constellations": _AVAILABLE_LIST
+            })
 
         # Find canonical state sourced from this constellation
         exact_match = None
@@ -1683,8 +2224,8 @@ async def get_constellation_coordinates(
                 "match_type": "inferred"
             }
 
-    if response_format == ResponseFormat.JSON:
-        return json.dumps(result, indent=2)
+    if response_format == "json":
+        return _dumps(result)
     else:
         md = f"# Coordinates: {result.get('state_name') or result['source_constellation']}\n\n"
         md += f"**Match type:** {result['match_type']}\n\n"
@@ -1707,7 +2248,7 @@ async def get_constellation_coordinates(
     }
 )
 async def list_constellation_presets(
-    response_format: ResponseFormat = ResponseFormat.JSON
+    response_format: ResponseFormat = "json"
 ) -> str:
     """
     List all available Phase 2.6 rhythmic presets with their parameters.
@@ -1741,15 +2282,15 @@ async def list_constellation_presets(
             "description": cfg["description"]
         }
 
-    if response_format == ResponseFormat.JSON:
-        return json.dumps({
+    if response_format == "json":
+        return _dumps({
             "presets": presets_info,
             "all_periods": sorted(set(
                 p["steps_per_cycle"] for p in CONSTELLATION_RHYTHMIC_PRESETS.values()
             )),
             "parameter_names": CONSTELLATION_PARAMETER_NAMES,
             "count": len(presets_info)
-        }, indent=2)
+        })
     else:
         md = "# Constellation Rhythmic Presets (Phase 2.6)\n\n"
         for name, info in presets_info.items():
@@ -1790,7 +2331,7 @@ async def apply_constellation_preset(params: RhythmicPresetInput) -> str:
     cfg = CONSTELLATION_RHYTHMIC_PRESETS[params.preset_name]
     trajectory = _generate_preset_trajectory(cfg)
 
-    return json.dumps({
+    return _dumps({
         "preset_name": params.preset_name,
         "period": cfg["steps_per_cycle"],
         "pattern": cfg["pattern"],
@@ -1800,7 +2341,7 @@ async def apply_constellation_preset(params: RhythmicPresetInput) -> str:
         "parameter_names": CONSTELLATION_PARAMETER_NAMES,
         "trajectory": trajectory,
         "trajectory_length": len(trajectory)
-    }, indent=2)
+    })
 
 
 @mcp.tool(
@@ -1833,14 +2374,14 @@ async def compute_constellation_trajectory(params: TrajectoryInput) -> str:
         for p in CONSTELLATION_PARAMETER_NAMES
     ))
 
-    return json.dumps({
+    return _dumps({
         "state_a": params.state_a,
         "state_b": params.state_b,
         "steps": params.steps,
         "euclidean_distance": round(dist, 4),
         "parameter_names": CONSTELLATION_PARAMETER_NAMES,
         "trajectory": trajectory
-    }, indent=2)
+    })
 
 
 @mcp.tool(
@@ -1882,21 +2423,21 @@ async def generate_constellation_attractor_prompt(params: AttractorPromptInput)
         state = CONSTELLATION_CANONICAL_STATES[params.canonical_state]
         coords = {p: state[p] for p in CONSTELLATION_PARAMETER_NAMES}
     else:
-        return json.dumps({
+        return _ENC.encode({
             "error": "Provide either 'coordinates' dict or 'canonical_state' name"
-        })
+        }).decode()
 
     vocab = _extract_visual_vocabulary(coords, params.strength)
 
     if params.mode == "composite":
         prompt = _generate_composite_prompt(coords, params.strength)
-        return json.dumps({
+        return _dumps({
             "mode": "composite",
             "prompt": prompt,
             "nearest_visual_type": vocab["nearest_type"],
             "type_distance": vocab["distance"],
             "coordinates": coords
-        }, indent=2)
+        })
 
     elif params.mode == "split_keywords":
         # Build categorized keyword sets
@@ -1932,24 +2473,24 @@ async def generate_constellation_attractor_prompt(params: AttractorPromptInput)
             else "moderate field of view"
         )
 
-        return json.dumps({
+        return _dumps({
             "mode": "split_keywords",
             "visual_type_keywords": vocab["keywords"],
             "parameter_descriptors": specs,
             "nearest_visual_type": vocab["nearest_type"],
             "type_distance": vocab["distance"],
             "coordinates": coords
-        }, indent=2)
+        })
 
     else:  # descriptive
         prompt = _generate_descriptive_prompt(coords, params.strength)
-        return json.dumps({
+        return _dumps({
             "mode": "descriptive",
             "prompt": prompt,
             "nearest_visual_type": vocab["nearest_type"],
             "type_distance": vocab["distance"],
             "coordinates": coords
-        }, indent=2)
+        })
 
 
 @mcp.tool(
@@ -1980,11 +2521,11 @@ async def get_constellation_visual_types() -> str:
             "keyword_count": len(type_data["keywords"])
         }
 
-    return json.dumps({
+    return _dumps({
         "visual_types": types_info,
         "count": len(types_info),
         "parameter_names": CONSTELLATION_PARAMETER_NAMES
-    }, indent=2)
+    })
 
 
 @mcp.tool(
@@ -2022,7 +2563,7 @@ async def get_constellation_domain_registry_config() -> str:
     for sname in CONSTELLATION_CANONICAL_STATES:
         state_coords[sname] = _get_state_coordinates(sname)
 
-    return json.dumps({
+    return _dumps({
         "domain_id": "constellation",
         "display_name": "Constellation Composition",
         "mcp_server": "constellation_composition_mcp",
@@ -2035,14 +2576,14 @@ async def get_constellation_domain_registry_config() -> str:
         )),
         "visual_types": list(CONSTELLATION_VISUAL_TYPES.keys()),
         "tier_4d_compatible": True
-    }, indent=2)
+    })
 
 
 # ============================================================================
 # COORDINATE INFERENCE FOR NON-CANONICAL CONSTELLATIONS
 # ============================================================================
 
-def _infer_coordinates_from_metadata(meta: Dict[str, Any]) -> Dict[str, float]:
+def _infer_coordinates_from_metadata(meta: Mapping[str, Any]) -> Dict[str, float]:
     """
     Infer approximate 5D coordinates from constellation metadata.
 
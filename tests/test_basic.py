@@ -32,3 +32,50 @@ async def test_composition_generation():
     """Test composition parameter generation."""
     # Import will be added after server.py is created
     pass
+
+
+def test_constellation_name_resolution():
+    """Test name and abbreviation lookup is case-insensitive."""
+    from constellation_composition_mcp.server import ConstellationCompositionInput
+
+    assert ConstellationCompositionInput(constellation_name="orion").constellation_name == "Orion"
+    assert ConstellationCompositionInput(constellation_name="UMA").constellation_name == "Ursa Major"
+    assert ConstellationCompositionInput(constellation_name=" Leo ").constellation_name == "Leo"
+    assert ConstellationCompositionInput(constellation_name="Nowhere").constellation_name == "Nowhere"
+    assert ConstellationCompositionInput(constellation_name="Leo" + " " * 48).constellation_name == "Leo"
+    with pytest.raises(ValueError):
+        ConstellationCompositionInput(constellation_name="   ")
+
+
+def test_constellations_read_only():
+    """Test the shared constellation table cannot be mutated."""
+    with pytest.raises(TypeError):
+        CONSTELLATIONS["Orion"]["abbr"] = "X"
+    with pytest.raises(TypeError):
+        CONSTELLATIONS["Nova"] = {}
+
+
+@pytest.mark.asyncio
+async def test_list_all_constellations():
+    """Test the catalogue listing in both formats."""
+    import json
+    from constellation_composition_mcp.server import list_all_constellations
+
+    payload = json.loads(await list_all_constellations("json"))
+    assert payload["total_count"] == len(CONSTELLATIONS)
+    assert [c["name"] for c in payload["constellations"]] == sorted(CONSTELLATIONS)
+
+    markdown = await list_all_constellations()
+    assert markdown.startswith(f"# Available Constellations ({len(CONSTELLATIONS)})")
+    assert markdown is await list_all_constellations("markdown")
+
+
+def test_json_responses_pretty_printed():
+    """Test _dumps emits the same indented layout as json.dumps(indent=2)."""
+    import json
+    import msgspec
+    from constellation_composition_mcp.server import _cached_composition, _dumps
+
+    payload = {"composition": _cached_composition("Orion", 1024, 1024, True), "empty": []}
+    expected = json.dumps(msgspec.to_builtins(payload), indent=2, ensure_ascii=False)
+    assert _dumps(payload) == expected
@@ -0,0 +1,172 @@
+"""Tests for constellation-to-composition mapping."""
+
+import json
+
+import msgspec
+import pytest
+from constellation_composition_mcp.server import (
+    CONSTELLATIONS,
+    _TEMPLATES,
+    _cached_composition_response,
+    _center_of_mass,
+    _composition_cache_clear,
+    _weighted_centroid,
+    calculate_balance,
+    determine_spatial_distribution,
+    determine_visual_flow,
+    extract_mythology_themes,
+    generate_focal_points,
+    map_constellation_to_composition,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_composition_cache():
+    """Start every test with an empty composition cache."""
+    _composition_cache_clear()
+    yield
+    _composition_cache_clear()
+
+
+def test_composition_memoized():
+    """Test repeated catalogue lookups return the cached parameters."""
+    first = map_constellation_to_composition("Orion", CONSTELLATIONS["Orion"], None, 1024, 1024, True)
+    second = map_constellation_to_composition("Orion", CONSTELLATIONS["Orion"], None, 1024, 1024, True)
+    assert first is second
+
+
+def test_composition_cache_bypassed_for_custom_metadata():
+    """Test metadata not taken from the catalogue is never served from cache."""
+    custom = dict(CONSTELLATIONS["Orion"], shape="w_zigzag")
+    cached = map_constellation_to_composition("Orion", CONSTELLATIONS["Orion"], None, 1024, 1024, True)
+    custom_result = map_constellation_to_composition("Orion", custom, None, 1024, 1024, True)
+    assert custom_result is not cached
+    assert custom_result.visual_flow.flow_type == "zigzag"
+
+
+def test_composition_response_cached_per_format():
+    """Test rendered responses are cached separately for each format."""
+    as_json = _cached_composition_response("Cygnus", 1920, 1080, True, "json")
+    as_markdown = _cached_composition_response("Cygnus", 1920, 1080, True, "markdown")
+    assert _cached_composition_response("Cygnus", 1920, 1080, True, "json") is as_json
+
+    payload = json.loads(as_json)
+    assert payload["abbreviation"] == "Cyg"
+    assert payload["canvas"] == {"width": 1920, "height": 1080}
+    assert payload["composition"]["visual_flow"]["flow_type"] == "bilateral"
+    assert as_markdown.startswith("# Constellation Composition: Cygnus")
+
+
+@pytest.mark.parametrize("name", sorted(CONSTELLATIONS))
+def test_balance_center_of_mass(name):
+    """Test the vectorized center of mass matches the weighted mean."""
+    data = CONSTELLATIONS[name]
+    points = generate_focal_points(data["brightness_profile"], data["shape"], 1024, 1024)
+    total = sum(p["weight"] for p in points)
+    expected_x = sum(p["x"] * p["weight"] for p in points) / total
+    expected_y = sum(p["y"] * p["weight"] for p in points) / total
+
+    center = calculate_balance(data["shape"], points).center_of_mass
+    assert center.x == pytest.approx(expected_x)
+    assert center.y == pytest.approx(expected_y)
+
+
+@pytest.mark.parametrize("shape, flow_type", [
+    ("linear_cascade", "cascading"),
+    ("curved_cross", "sinuous"),
+    ("cross_belt", "centered"),
+    ("w_dipper", "zigzag"),
+    ("small_dipper", "segmented"),
+    ("teapot", "balanced"),
+])
+def test_visual_flow_priority(shape, flow_type):
+    """Test the first matching shape token in priority order wins."""
+    assert determine_visual_flow(shape, None).flow_type == flow_type
+
+
+@pytest.mark.parametrize("shape, star_count, distribution", [
+    ("compact_cascade", 12, "clustered_central"),
+    ("dispersed_linear", 3, "scattered_wide"),
+    ("hourglass_belt", 10, "linear_arrangement"),
+    ("teapot", 5, "minimal_sparse"),
+    ("teapot", 10, "complex_dense"),
+    ("teapot", 7, "moderate_distributed"),
+])
+def test_spatial_distribution(shape, star_count, distribution):
+    """Test shape tokens take precedence over the star count fallback."""
+    assert determine_spatial_distribution(shape, star_count) == distribution
+
+
+def test_composition_parameters_immutable():
+    """Test composition results are frozen, slotted and serialize without validation."""
+    composition = map_constellation_to_composition(
+        "Lyra", CONSTELLATIONS["Lyra"], None, 1024, 1024, True
+    )
+    assert not hasattr(composition, "__dict__")
+    with pytest.raises(AttributeError):
+        composition.spatial_distribution = "dispersed"
+
+    payload = json.loads(msgspec.json.encode(composition))
+    assert set(payload) == set(composition.__struct_fields__)
+
+
+def test_curved_sweep_focal_points():
+    """Test the curved sweep follows a half sine arc with a heavier head."""
+    points = generate_focal_points("moderate", "curved_tail", 1024, 1024)
+    assert len(points) == 7
+    assert [p["weight"] for p in points] == [0.4, 0.4, 0.2, 0.2, 0.2, 0.2, 0.2]
+    assert points[0]["x"] == pytest.approx(0.2) and points[-1]["x"] == pytest.approx(0.8)
+    assert points[3]["y"] == pytest.approx(0.7)
+
+
+def test_custom_metadata_defaults():
+    """Test sparse custom metadata falls back to the documented defaults."""
+    composition = map_constellation_to_composition(
+        "Custom", {"theme": "Journey, Hope"}, None, 800, 600, True
+    )
+    assert composition.spatial_distribution == "scattered_wide"
+    assert composition.mythology_themes == ("journey", "hope")
+    assert extract_mythology_themes({}) == []
+
+
+def test_visual_flow_singletons_read_only():
+    """Test visual flow results are shared constants that cannot be mutated."""
+    flow = determine_visual_flow("belt_hourglass", None)
+    assert determine_visual_flow("belt_hourglass", None) is flow
+    with pytest.raises(AttributeError):
+        flow.flow_type = "sinuous"
+
+
+@pytest.mark.parametrize("name", sorted(CONSTELLATIONS))
+def test_weighted_centroid_matches_center_of_mass(name):
+    """Test the JIT-able loop kernel reproduces the center of mass exactly."""
+    focal_xy, focal_w = _TEMPLATES[name]
+    assert _weighted_centroid(focal_xy, focal_w) == tuple(_center_of_mass(focal_xy, focal_w))
+
+
+def test_dispersed_focal_points_deterministic():
+    """Test the dispersed pattern is a fixed table that leaves global random state alone."""
+    import random
+
+    state = random.getstate()
+    points = generate_focal_points("moderate", "dispersed", 1024, 1024)
+    assert random.getstate() == state
+
+    rng = random.Random(42)
+    expected = [
+        (0.2 + rng.random() * 0.6, 0.2 + rng.random() * 0.6, 0.2 + rng.random() * 0.2)
+        for _ in range(6)
+    ]
+    assert [(p["x"], p["y"], p["weight"]) for p in points] == expected
+    assert generate_focal_points("moderate", "dispersed", 1024, 1024) == points
+
+
+def test_memoized_composition_fields_immutable():
+    """Test the shared catalogue composition exposes no mutable containers."""
+    composition = map_constellation_to_composition(
+        "Orion", CONSTELLATIONS["Orion"], None, 1024, 1024, True
+    )
+    assert isinstance(composition.focal_points, tuple)
+    assert isinstance(composition.mythology_themes, tuple)
+    with pytest.raises(AttributeError):
+        composition.mythology_themes.append("injected")
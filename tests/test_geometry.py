@@ -0,0 +1,111 @@
+"""Tests for the cached constellation geometry lookup."""
+
+import asyncio
+import json
+
+import pytest
+from constellation_composition_mcp import server
+
+FEATURES = {
+    "type": "FeatureCollection",
+    "features": [
+        {"type": "Feature", "properties": {"id": "Ori"}, "geometry": {"type": "MultiLineString", "coordinates": []}},
+        {"type": "Feature", "properties": {"id": "Cyg"}, "geometry": {"type": "MultiLineString", "coordinates": []}},
+    ],
+}
+
+
+@pytest.fixture
+def geojson_source(monkeypatch, tmp_path):
+    """Replace the network download with a counting fake and isolate the cache."""
+    calls = []
+
+    async def fake_download():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return FEATURES
+
+    monkeypatch.setattr(server, "_download_geojson", fake_download)
+    monkeypatch.setattr(server, "_GEOJSON_CACHE_PATH", tmp_path / "lines.geojson")
+    monkeypatch.setattr(server, "_GEOJSON_INDEX", {})
+    monkeypatch.setattr(server, "_GEOJSON_EXPIRES_AT", 0.0)
+    monkeypatch.setattr(server, "_GEOJSON_LOCK", asyncio.Lock())
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_geojson_fetched_once_for_concurrent_callers(geojson_source):
+    """Test concurrent lookups share one download and hit the index."""
+    results = await asyncio.gather(*(server.fetch_constellation_data("Ori") for _ in range(5)))
+    assert len(geojson_source) == 1
+    assert all(r["properties"]["id"] == "Ori" for r in results)
+
+    assert (await server.fetch_constellation_data("Cyg"))["properties"]["id"] == "Cyg"
+    assert await server.fetch_constellation_data("Xyz") is None
+    assert len(geojson_source) == 1
+
+
+@pytest.mark.asyncio
+async def test_geojson_refetched_after_expiry(geojson_source, monkeypatch):
+    """Test an expired index triggers a new load."""
+    await server.fetch_constellation_data("Ori")
+    monkeypatch.setattr(server, "_GEOJSON_EXPIRES_AT", 0.0)
+    await server.fetch_constellation_data("Ori")
+    assert len(geojson_source) == 2
+
+
+@pytest.mark.asyncio
+async def test_geojson_loaded_from_fresh_disk_copy(geojson_source):
+    """Test a fresh on-disk copy is used instead of downloading."""
+    server._GEOJSON_CACHE_PATH.write_bytes(server._ENC.encode(FEATURES))
+    assert (await server.fetch_constellation_data("Cyg"))["properties"]["id"] == "Cyg"
+    assert geojson_source == []
+
+
+def test_disk_cache_can_be_disabled(monkeypatch):
+    """Test a disabled disk cache neither reads nor writes a file."""
+    monkeypatch.setattr(server, "_GEOJSON_CACHE_PATH", None)
+    server._write_geojson_cache_file(server._ENC.encode(FEATURES))
+    assert server._read_geojson_cache_file() is None
+
+
+@pytest.mark.asyncio
+async def test_http_client_shared_until_closed(monkeypatch):
+    """Test the HTTP client is reused across calls and recreated after close."""
+    monkeypatch.setattr(server, "_HTTP_CLIENT", None)
+    client = server._get_http_client()
+    assert server._get_http_client() is client
+
+    await server._close_http_client()
+    assert client.is_closed
+    assert server._HTTP_CLIENT is None
+
+
+@pytest.mark.asyncio
+async def test_composition_skips_fetch_unless_geometry_requested(geojson_source):
+    """Test geometry is only fetched, and returned, when include_geometry is set."""
+    server._composition_cache_clear()
+    plain = json.loads(await server.generate_constellation_composition(
+        server.ConstellationCompositionInput(constellation_name="Orion")
+    ))
+    assert geojson_source == []
+    assert "geometry" not in plain
+
+    with_geometry = json.loads(await server.generate_constellation_composition(
+        server.ConstellationCompositionInput(constellation_name="Orion", include_geometry=True)
+    ))
+    assert len(geojson_source) == 1
+    assert with_geometry["geometry"]["properties"]["id"] == "Ori"
+    assert with_geometry["composition"] == plain["composition"]
+
+
+@pytest.mark.asyncio
+async def test_markdown_composition_never_fetches_geometry(geojson_source):
+    """Test markdown output skips the fetch since it cannot carry geometry."""
+    output = await server.generate_constellation_composition(
+        server.ConstellationCompositionInput(
+            constellation_name="Orion", include_geometry=True, response_format="markdown"
+        )
+    )
+    assert geojson_source == []
+    assert output.startswith("# Constellation Composition: Orion")
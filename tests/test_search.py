@@ -0,0 +1,53 @@
+"""Tests for constellation search."""
+
+import json
+
+import pytest
+from constellation_composition_mcp.server import (
+    ConstellationSearchInput,
+    search_constellations,
+)
+
+
+async def _search_names(**kwargs):
+    output = await search_constellations(ConstellationSearchInput(response_format="json", **kwargs))
+    if output.startswith("No constellations found"):
+        return []
+    return [c["name"] for c in json.loads(output)["constellations"]]
+
+
+@pytest.mark.asyncio
+async def test_shape_filter_matches_substring():
+    """Test shape filters match any shape containing the term."""
+    assert await _search_names(shape_type="CURVED") == ["Aries", "Perseus", "Scorpius"]
+
+
+@pytest.mark.asyncio
+async def test_brightness_filter_combines_with_shape():
+    """Test shape and brightness filters are applied together."""
+    assert await _search_names(shape_type="compact", brightness="extremely_bright") == [
+        "Canis Major",
+        "Lyra",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_query_matches_text_fields():
+    """Test free-text query matches name, story, theme and visual character."""
+    assert await _search_names(query="hunt") == ["Canis Major", "Orion"]
+    assert await _search_names(query="hunt", brightness="faint") == []
+
+
+@pytest.mark.asyncio
+async def test_query_is_phrase_substring():
+    """Test multi-word queries match as a phrase, not as separate words."""
+    assert await _search_names(query="Great hunter") == ["Orion"]
+    assert await _search_names(query="hunter great") == []
+    assert await _search_names(query="'s lyre") == ["Lyra"]
+
+
+@pytest.mark.asyncio
+async def test_filters_combine_with_query():
+    """Test category filters and the text query must all match."""
+    assert await _search_names(query="hunt", shape_type="belt") == ["Orion"]
+    assert await _search_names(query="hunt", shape_type="no_such_shape") == []